@@ -64,6 +64,25 @@ export async function checkUserPermission(
   }
 }
 
+/**
+ * Checks every permission concurrently and returns the results in input order
+ * 
+ * @param userId - User ID to check permissions for
+ * @param permissions - Array of permission codes
+ * @param role - User role, passed through to enable the admin bypass
+ * @returns Promise resolving to one boolean per permission
+ */
+function checkEachPermission(
+  userId: number,
+  permissions: (SystemPermission | string)[],
+  role?: string
+): Promise<boolean[]> {
+  return Promise.all(permissions.map(permission => {
+    const normalizedPermission = permission.toString().trim().toLowerCase();
+    return permissionMiddleware.hasPermission(userId, normalizedPermission, role);
+  }));
+}
+
 /**
  * Checks if a user has any of the specified permissions
  * 
@@ -105,19 +124,11 @@ export async function checkUserHasAnyPermission(
       return true;
     }
     
-    // Check each permission individually using the permission middleware
-    for (const permission of permissions) {
-      const normalizedPermission = permission.toString().trim().toLowerCase();
-      
-      // 🔑 FIX: Pass the role parameter to enable admin bypass
-      const hasPermission = await permissionMiddleware.hasPermission(userId, normalizedPermission, role);
-      
-      if (hasPermission) {
-        return true; // User has at least one of the required permissions
-      }
-    }
+    // Check all permissions concurrently using the permission middleware
+    const results = await checkEachPermission(userId, permissions, role);
     
-    return false; // User doesn't have any of the required permissions
+    // True if the user has at least one of the required permissions
+    return results.some(Boolean);
   } catch (error) {
     logger.error('Error checking user permissions:', {
       error: error instanceof Error ? error.message : String(error),
@@ -163,19 +174,11 @@ export async function checkUserHasAllPermissions(
       return true;
     }
     
-    // Check each permission individually using the permission middleware
-    for (const permission of permissions) {
-      const normalizedPermission = permission.toString().trim().toLowerCase();
-      
-      // 🔑 FIX: Pass the role parameter to enable admin bypass
-      const hasPermission = await permissionMiddleware.hasPermission(userId, normalizedPermission, role);
-      
-      if (!hasPermission) {
-        return false; // User is missing at least one required permission
-      }
-    }
+    // Check all permissions concurrently using the permission middleware
+    const results = await checkEachPermission(userId, permissions, role);
     
-    return true; // User has all required permissions
+    // False if the user is missing at least one required permission
+    return results.every(Boolean);
   } catch (error) {
     logger.error('Error checking user permissions:', {
       error: error instanceof Error ? error.message : String(error),
@@ -28,7 +28,6 @@ import { Breadcrumb, BreadcrumbItem, BreadcrumbLink, BreadcrumbList, BreadcrumbS
 import { useRouter } from 'next/navigation';
 import { PermissionClient } from '@/features/permissions/lib/clients/PermissionClient';
 import { createPermissionDefinitionList, getAllPermissionCodes } from '@/domain/permissions/SystemPermissionMap';
-import { SystemPermission } from '@/domain/enums/PermissionEnums';
 import { UserRole } from '@/domain/enums/UserEnums';
 import PermissionRoleManager from './components/PermissionRoleManager';
 import PermissionUserAssignment from './components/PermissionUserAssignment';
@@ -57,12 +56,8 @@ export default function PermissionsPage() {
         throw new Error('Failed to initialize token');
       }
       
-      // Get all possible permission codes from the enum
-      const allEnumPermCodes = Object.values(SystemPermission).map(p => p.toString());
-      console.log(`Found ${allEnumPermCodes.length} permissions in SystemPermission enum`);
-      
-      // Create definitions for all permissions defined in the enum
-      const allDefinitions = createPermissionDefinitionList(allEnumPermCodes);
+      // Create definitions for all permissions defined in the SystemPermission enum
+      const allDefinitions = createPermissionDefinitionList();
       setPermissionDefinitions(allDefinitions);
       console.log(`Created ${allDefinitions.length} permission definitions`);
       
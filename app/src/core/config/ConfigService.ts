@@ -38,6 +38,15 @@ export interface LoggingConfig {
  * Provides access to application configuration
  */
 class ConfigService {
+  /**
+   * Parsed configuration sections, built on first access.
+   * Environment variables don't change while the process runs.
+   * The sections are frozen because every caller shares the same object.
+   */
+  private securityConfig?: Readonly<SecurityConfig>;
+  private jwtConfig?: Readonly<JwtConfig>;
+  private loggingConfig?: Readonly<LoggingConfig>;
+
   /**
    * Get a configuration value by key
    * @param key Configuration key
@@ -118,8 +127,8 @@ class ConfigService {
    * Get security configuration
    * @returns Security configuration
    */
-  getSecurityConfig(): SecurityConfig {
-    return {
+  getSecurityConfig(): Readonly<SecurityConfig> {
+    return this.securityConfig ??= Object.freeze({
       jwtSecret: process.env.JWT_SECRET || 'development-jwt-secret',
       accessTokenExpiry: parseInt(process.env.ACCESS_TOKEN_EXPIRY || '900', 10), // 15 minutes in seconds
       refreshTokenExpiry: parseInt(process.env.REFRESH_TOKEN_EXPIRY || '7', 10), // 7 days
@@ -127,35 +136,33 @@ class ConfigService {
       passwordRequireUppercase: process.env.PASSWORD_REQUIRE_UPPERCASE !== 'false',
       passwordRequireNumber: process.env.PASSWORD_REQUIRE_NUMBER !== 'false',
       passwordRequireSymbol: process.env.PASSWORD_REQUIRE_SYMBOL !== 'false'
-    };
+    });
   }
   
   /**
    * Get JWT configuration
    * @returns JWT configuration
    */
-  getJwtConfig(): JwtConfig {
-    return {
+  getJwtConfig(): Readonly<JwtConfig> {
+    return this.jwtConfig ??= Object.freeze({
       secret: process.env.JWT_SECRET || 'development-jwt-secret',
       accessTokenExpiry: parseInt(process.env.ACCESS_TOKEN_EXPIRY || '900', 10), // 15 minutes in seconds
       refreshTokenExpiry: parseInt(process.env.REFRESH_TOKEN_EXPIRY || '7', 10), // 7 days
       audience: process.env.JWT_AUDIENCE || 'rising-bsm-app',
       issuer: process.env.JWT_ISSUER || 'rising-bsm'
-    };
+    });
   }
   
   /**
    * Get logging configuration
    * @returns Logging configuration
    */
-  getLoggingConfig(): LoggingConfig {
-    // Higher logging in development, less in production
-    const defaultLevel = this.isDevelopment() ? 'debug' : 'info';
-    
-    return {
-      level: (process.env.LOG_LEVEL || defaultLevel) as LoggingConfig['level'],
+  getLoggingConfig(): Readonly<LoggingConfig> {
+    return this.loggingConfig ??= Object.freeze({
+      // Higher logging in development, less in production
+      level: (process.env.LOG_LEVEL || (this.isDevelopment() ? 'debug' : 'info')) as LoggingConfig['level'],
       includeTimestamps: process.env.LOG_TIMESTAMPS !== 'false'
-    };
+    });
   }
 }
 
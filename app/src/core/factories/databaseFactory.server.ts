@@ -2,6 +2,7 @@
 import 'server-only';
 import { PrismaClient } from '@prisma/client';
 import { prisma as prismaInstance } from '@/core/db/prisma/server-client';
+import { getLogger } from '@/core/logging';
 
 // Singleton instance for Prisma
 let prismaClient: PrismaClient | null = null;
@@ -13,6 +14,15 @@ let prismaClient: PrismaClient | null = null;
 export function getPrismaClient(): PrismaClient {
   if (!prismaClient) {
     prismaClient = prismaInstance;
+    
+    // Open the connection right away instead of on the first query, so the
+    // first request doesn't pay for the connection setup. Not awaited; if it
+    // fails, Prisma simply connects lazily as before.
+    prismaClient.$connect().catch((error: unknown) => {
+      getLogger().warn('Prisma pre-connect failed, will connect on first query', {
+        error: error instanceof Error ? error.message : String(error)
+      });
+    });
   }
   return prismaClient;
 }
@@ -219,22 +219,23 @@ export class LoggingService implements ILoggingService {
    */
   private log(level: LogLevel, message: string, meta?: Record<string, any>): void {
     const timestamp = new Date().toISOString();
-    const correlationId = this.context.correlationId || 'none';
-    
-    const logData = {
-      timestamp,
-      level,
-      message,
-      correlationId,
-      ...this.context,
-      ...(meta || {})
-    };
     
     // Output the log based on format
     switch (this.format) {
-      case LogFormat.JSON:
+      case LogFormat.JSON: {
+        // Only the JSON format needs the merged record, so build it here
+        // and serialize it in a single pass
+        const logData = {
+          timestamp,
+          level,
+          message,
+          correlationId: this.context.correlationId || 'none',
+          ...this.context,
+          ...meta
+        };
         console.log(JSON.stringify(logData));
         break;
+      }
       
       case LogFormat.PRETTY:
         // Color output based on level
@@ -17,6 +17,69 @@ import {
 import { ValidationResult as ValidationResultEnum, ValidationErrorType } from '@/domain/enums/ValidationResults';
 import { getLogger } from '../logging';
 
+/**
+ * Object schema with typed field definitions
+ */
+interface NamedSchema {
+  properties: SchemaDefinition;
+  required?: string[];
+}
+
+/**
+ * Named schemas available to validate(schemaName, data)
+ * 
+ * Built once at module load instead of on every lookup
+ */
+const NAMED_SCHEMAS: Readonly<Record<string, NamedSchema>> = Object.freeze({
+  createUser: {
+    properties: {
+      name: { type: 'string', required: true, minLength: 1, maxLength: 255 },
+      email: { type: 'string', required: true, format: 'email' },
+      password: { type: 'string', required: true, minLength: 8 },
+      role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
+      status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
+    },
+    required: ['name', 'email', 'password']
+  },
+  updateUser: {
+    properties: {
+      name: { type: 'string', minLength: 1, maxLength: 255 },
+      email: { type: 'string', format: 'email' },
+      role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
+      status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
+    }
+  },
+  createCustomer: {
+    properties: {
+      name: { type: 'string', required: true, minLength: 1, maxLength: 255 },
+      email: { type: 'string', format: 'email' },
+      phone: { type: 'string' },
+      address: { type: 'string' },
+      city: { type: 'string' },
+      state: { type: 'string' },
+      country: { type: 'string' },
+      postalCode: { type: 'string' },
+      company: { type: 'string' },
+      status: { type: 'string', enum: ['active', 'inactive', 'deleted'] }
+    },
+    required: ['name']
+  },
+  updateCustomer: {
+    properties: {
+      name: { type: 'string', minLength: 1, maxLength: 255 },
+      email: { type: 'string', format: 'email' },
+      phone: { type: 'string' },
+      address: { type: 'string' },
+      city: { type: 'string' },
+      state: { type: 'string' },
+      country: { type: 'string' },
+      postalCode: { type: 'string' },
+      company: { type: 'string' },
+      status: { type: 'string', enum: ['active', 'inactive', 'deleted'] }
+    }
+  }
+});
+
 export class ValidationService implements IValidationService {
   private readonly logger = getLogger();
   
@@ -195,15 +258,7 @@ export class ValidationService implements IValidationService {
    * Validate user creation data
    */
   validateCreateUser(data: any): ValidationResult {
-    const schema: SchemaDefinition = {
-      name: { type: 'string', required: true, minLength: 1, maxLength: 255 },
-      email: { type: 'string', required: true, format: 'email' },
-      password: { type: 'string', required: true, minLength: 8 },
-      role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
-      status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
-    };
-    
-    const result = this.validate(data, { properties: schema, required: ['name', 'email', 'password'] });
+    const result = this.validate(data, NAMED_SCHEMAS.createUser);
     
     // Additional email validation
     if (data.email && !this.validateEmail(data.email)) {
@@ -225,14 +280,7 @@ export class ValidationService implements IValidationService {
    * Validate user update data
    */
   validateUpdateUser(data: any): ValidationResult {
-    const schema: SchemaDefinition = {
-      name: { type: 'string', minLength: 1, maxLength: 255 },
-      email: { type: 'string', format: 'email' },
-      role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
-      status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
-    };
-    
-    const result = this.validate(data, { properties: schema });
+    const result = this.validate(data, NAMED_SCHEMAS.updateUser);
     
     // Additional email validation if email is provided
     if (data.email && !this.validateEmail(data.email)) {
@@ -341,77 +389,9 @@ export class ValidationService implements IValidationService {
    */
   private getSchemaByName(schemaName: string): any {
     // This could be extended to load schemas from files or a registry
-    switch (schemaName) {
-      case 'createUser':
-        return this.getUserCreateSchema();
-      case 'updateUser':
-        return this.getUserUpdateSchema();
-      case 'createCustomer':
-        return this.getCustomerCreateSchema();
-      case 'updateCustomer':
-        return this.getCustomerUpdateSchema();
-      default:
-        return {};
-    }
-  }
-  
-  private getUserCreateSchema(): any {
-    return {
-      properties: {
-        name: { type: 'string', required: true, minLength: 1, maxLength: 255 },
-        email: { type: 'string', required: true, format: 'email' },
-        password: { type: 'string', required: true, minLength: 8 },
-        role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
-        status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
-      },
-      required: ['name', 'email', 'password']
-    };
-  }
-  
-  private getUserUpdateSchema(): any {
-    return {
-      properties: {
-        name: { type: 'string', minLength: 1, maxLength: 255 },
-        email: { type: 'string', format: 'email' },
-        role: { type: 'string', enum: ['admin', 'manager', 'employee', 'user'] },
-        status: { type: 'string', enum: ['active', 'inactive', 'suspended', 'deleted'] }
-      }
-    };
-  }
-  
-  private getCustomerCreateSchema(): any {
-    return {
-      properties: {
-        name: { type: 'string', required: true, minLength: 1, maxLength: 255 },
-        email: { type: 'string', format: 'email' },
-        phone: { type: 'string' },
-        address: { type: 'string' },
-        city: { type: 'string' },
-        state: { type: 'string' },
-        country: { type: 'string' },
-        postalCode: { type: 'string' },
-        company: { type: 'string' },
-        status: { type: 'string', enum: ['active', 'inactive', 'deleted'] }
-      },
-      required: ['name']
-    };
-  }
-  
-  private getCustomerUpdateSchema(): any {
-    return {
-      properties: {
-        name: { type: 'string', minLength: 1, maxLength: 255 },
-        email: { type: 'string', format: 'email' },
-        phone: { type: 'string' },
-        address: { type: 'string' },
-        city: { type: 'string' },
-        state: { type: 'string' },
-        country: { type: 'string' },
-        postalCode: { type: 'string' },
-        company: { type: 'string' },
-        status: { type: 'string', enum: ['active', 'inactive', 'deleted'] }
-      }
-    };
+    return Object.prototype.hasOwnProperty.call(NAMED_SCHEMAS, schemaName)
+      ? NAMED_SCHEMAS[schemaName]
+      : {};
   }
 }
 
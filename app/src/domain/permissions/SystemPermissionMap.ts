@@ -323,6 +323,9 @@ export const SystemPermissionMap: Record<string, PermissionDefinition> = {
   }
 };
 
+// Definitions are shared by every caller, so freeze them once at load time
+Object.values(SystemPermissionMap).forEach(definition => Object.freeze(definition));
+
 /**
  * Utility function to get a permission definition by code
  * 
@@ -336,61 +339,61 @@ export function getPermissionDefinition(code: SystemPermission | string): Permis
   return SystemPermissionMap[code];
 }
 
+/**
+ * Resolves a permission definition, generating one from the code if it is not in the map
+ * 
+ * @param code Permission code
+ * @returns Permission definition
+ */
+function resolvePermissionDefinition(code: string): PermissionDefinition {
+  // If definition exists in map, use it
+  if (SystemPermissionMap[code]) {
+    return SystemPermissionMap[code];
+  }
+  
+  // Otherwise generate a definition based on the code
+  const parts = code.split('.');
+  const category = parts[0] ? parts[0].charAt(0).toUpperCase() + parts[0].slice(1) : 'Other';
+  const action = parts[1] ? parts[1].charAt(0).toUpperCase() + parts[1].slice(1) : 'Access';
+  
+  return {
+    code,
+    name: `${action} ${category}`,
+    description: `Can ${parts[1] || 'access'} ${parts[0] || 'system'}`,
+    category,
+    action: parts[1] || 'access'
+  };
+}
+
+// Definitions for every system permission, built on first request.
+// The enum and map are static, so the list never changes. Map entries are
+// already frozen; the definitions generated here are frozen as they are built.
+let allPermissionDefinitions: readonly Readonly<PermissionDefinition>[] | null = null;
+
 /**
  * Creates a permission definition list from all system permissions or a subset
  * No fallbacks or workarounds - ensures all permissions are properly handled
  * 
+ * When called without codes, the returned array is a fresh copy but its
+ * definition objects are frozen and shared between callers.
+ * 
  * @param permissionCodes Optional subset of permission codes to include
  * @returns List of permission definitions
  */
 export function createPermissionDefinitionList(permissionCodes?: string[]): PermissionDefinition[] {
   // If no codes provided, return all permissions
   if (!permissionCodes || !Array.isArray(permissionCodes) || permissionCodes.length === 0) {
-    // Ensure we get all system permissions first
-    const allSystemPermCodes = Object.values(SystemPermission).map(p => p.toString());
+    if (!allPermissionDefinitions) {
+      allPermissionDefinitions = Object.freeze(Object.values(SystemPermission)
+        .map(p => Object.freeze(resolvePermissionDefinition(p.toString()))));
+    }
     
-    // Get definitions for all permissions
-    return allSystemPermCodes.map(code => {
-      // If definition exists in map, use it
-      if (SystemPermissionMap[code]) {
-        return SystemPermissionMap[code];
-      }
-      
-      // Otherwise generate a definition based on the code
-      const parts = code.split('.');
-      const category = parts[0] ? parts[0].charAt(0).toUpperCase() + parts[0].slice(1) : 'Other';
-      const action = parts[1] ? parts[1].charAt(0).toUpperCase() + parts[1].slice(1) : 'Access';
-      
-      return {
-        code,
-        name: `${action} ${category}`,
-        description: `Can ${parts[1] || 'access'} ${parts[0] || 'system'}`,
-        category,
-        action: parts[1] || 'access'
-      };
-    });
+    // Return a copy so callers can sort or filter without affecting the cache
+    return [...allPermissionDefinitions];
   }
   
   // Otherwise, return only the requested permissions
-  return permissionCodes.map(code => {
-    // If definition exists in map, use it
-    if (SystemPermissionMap[code]) {
-      return SystemPermissionMap[code];
-    }
-    
-    // Otherwise generate a definition
-    const parts = code.split('.');
-    const category = parts[0] ? parts[0].charAt(0).toUpperCase() + parts[0].slice(1) : 'Other';
-    const action = parts[1] ? parts[1].charAt(0).toUpperCase() + parts[1].slice(1) : 'Access';
-    
-    return {
-      code,
-      name: `${action} ${category}`,
-      description: `Can ${parts[1] || 'access'} ${parts[0] || 'system'}`,
-      category,
-      action: parts[1] || 'access'
-    };
-  });
+  return permissionCodes.map(resolvePermissionDefinition);
 }
 
 /**
@@ -408,11 +411,99 @@ export function getAllPermissionCodes(): string[] {
  */
 export function findMissingPermissions(): string[] {
   const allEnumPermissions = Object.values(SystemPermission).map(p => p.toString());
-  const definedPermissions = Object.keys(SystemPermissionMap);
+  const definedPermissions = new Set(Object.keys(SystemPermissionMap));
   
-  return allEnumPermissions.filter(p => !definedPermissions.includes(p));
+  return allEnumPermissions.filter(p => !definedPermissions.has(p));
 }
 
+// Basic permissions that all roles should have
+const BASIC_ROLE_PERMISSIONS: readonly string[] = Object.freeze([
+  SystemPermission.PROFILE_VIEW,
+  SystemPermission.PROFILE_EDIT,
+  SystemPermission.DASHBOARD_ACCESS
+]);
+
+// Default permissions per role, built once at module load
+const DEFAULT_ROLE_PERMISSIONS: ReadonlyMap<string, readonly string[]> = new Map([
+  ['admin', Object.freeze([
+    ...BASIC_ROLE_PERMISSIONS,
+    SystemPermission.USERS_VIEW,
+    SystemPermission.USERS_CREATE,
+    SystemPermission.USERS_EDIT,
+    SystemPermission.USERS_DELETE,
+    SystemPermission.PERMISSIONS_VIEW,
+    SystemPermission.PERMISSIONS_MANAGE,
+    SystemPermission.CUSTOMERS_VIEW,
+    SystemPermission.CUSTOMERS_CREATE,
+    SystemPermission.CUSTOMERS_EDIT,
+    SystemPermission.CUSTOMERS_DELETE,
+    SystemPermission.REQUESTS_VIEW,
+    SystemPermission.REQUESTS_CREATE,
+    SystemPermission.REQUESTS_EDIT,
+    SystemPermission.REQUESTS_DELETE,
+    SystemPermission.REQUESTS_APPROVE,
+    SystemPermission.REQUESTS_REJECT,
+    SystemPermission.REQUESTS_ASSIGN,
+    SystemPermission.REQUESTS_CONVERT,
+    SystemPermission.APPOINTMENTS_VIEW,
+    SystemPermission.APPOINTMENTS_CREATE,
+    SystemPermission.APPOINTMENTS_EDIT,
+    SystemPermission.APPOINTMENTS_DELETE,
+    SystemPermission.AUTOMATION_VIEW,
+    SystemPermission.AUTOMATION_CREATE,
+    SystemPermission.AUTOMATION_EDIT,
+    SystemPermission.AUTOMATION_DELETE,
+    SystemPermission.AUTOMATION_MANAGE,
+    SystemPermission.API_KEYS_VIEW,
+    SystemPermission.API_KEYS_CREATE,
+    SystemPermission.API_KEYS_EDIT,
+    SystemPermission.API_KEYS_DELETE,
+    SystemPermission.API_KEYS_MANAGE,
+    SystemPermission.NOTIFICATIONS_VIEW,
+    SystemPermission.SETTINGS_VIEW,
+    SystemPermission.SETTINGS_EDIT,
+    SystemPermission.SYSTEM_ADMIN
+  ])],
+  ['manager', Object.freeze([
+    ...BASIC_ROLE_PERMISSIONS,
+    SystemPermission.USERS_VIEW,
+    SystemPermission.CUSTOMERS_VIEW,
+    SystemPermission.CUSTOMERS_CREATE,
+    SystemPermission.CUSTOMERS_EDIT,
+    SystemPermission.REQUESTS_VIEW,
+    SystemPermission.REQUESTS_CREATE,
+    SystemPermission.REQUESTS_EDIT,
+    SystemPermission.REQUESTS_APPROVE,
+    SystemPermission.REQUESTS_REJECT,
+    SystemPermission.REQUESTS_ASSIGN,
+    SystemPermission.APPOINTMENTS_VIEW,
+    SystemPermission.APPOINTMENTS_CREATE,
+    SystemPermission.APPOINTMENTS_EDIT,
+    SystemPermission.AUTOMATION_VIEW,
+    SystemPermission.AUTOMATION_CREATE,
+    SystemPermission.AUTOMATION_EDIT,
+    SystemPermission.API_KEYS_VIEW,
+    SystemPermission.API_KEYS_CREATE,
+    SystemPermission.API_KEYS_EDIT,
+    SystemPermission.NOTIFICATIONS_VIEW,
+    SystemPermission.SETTINGS_VIEW
+  ])],
+  ['employee', Object.freeze([
+    ...BASIC_ROLE_PERMISSIONS,
+    SystemPermission.CUSTOMERS_VIEW,
+    SystemPermission.REQUESTS_VIEW,
+    SystemPermission.REQUESTS_CREATE,
+    SystemPermission.APPOINTMENTS_VIEW,
+    SystemPermission.APPOINTMENTS_CREATE,
+    SystemPermission.NOTIFICATIONS_VIEW
+  ])],
+  ['user', Object.freeze([
+    ...BASIC_ROLE_PERMISSIONS,
+    SystemPermission.REQUESTS_CREATE,
+    SystemPermission.NOTIFICATIONS_VIEW
+  ])]
+]);
+
 /**
  * Gets default permissions for a specific role
  * This is the canonical source of default permissions for all roles
@@ -421,100 +512,9 @@ export function findMissingPermissions(): string[] {
  * @returns Array of permission codes for the role
  */
 export function getDefaultPermissionsForRole(role: string): string[] {
-  // Basic permissions that all roles should have
-  const basicPermissions = [
-    SystemPermission.PROFILE_VIEW,
-    SystemPermission.PROFILE_EDIT,
-    SystemPermission.DASHBOARD_ACCESS
-  ];
-  
   // Normalize role to lowercase
   const normalizedRole = role.toLowerCase();
   
-  // Return appropriate permissions based on role
-  switch(normalizedRole) {
-    case 'admin':
-      return [
-        ...basicPermissions,
-        SystemPermission.USERS_VIEW,
-        SystemPermission.USERS_CREATE,
-        SystemPermission.USERS_EDIT,
-        SystemPermission.USERS_DELETE,
-        SystemPermission.PERMISSIONS_VIEW,
-        SystemPermission.PERMISSIONS_MANAGE,
-        SystemPermission.CUSTOMERS_VIEW,
-        SystemPermission.CUSTOMERS_CREATE,
-        SystemPermission.CUSTOMERS_EDIT,
-        SystemPermission.CUSTOMERS_DELETE,
-        SystemPermission.REQUESTS_VIEW,
-        SystemPermission.REQUESTS_CREATE,
-        SystemPermission.REQUESTS_EDIT,
-        SystemPermission.REQUESTS_DELETE,
-        SystemPermission.REQUESTS_APPROVE,
-        SystemPermission.REQUESTS_REJECT,
-        SystemPermission.REQUESTS_ASSIGN,
-        SystemPermission.REQUESTS_CONVERT,
-        SystemPermission.APPOINTMENTS_VIEW,
-        SystemPermission.APPOINTMENTS_CREATE,
-        SystemPermission.APPOINTMENTS_EDIT,
-        SystemPermission.APPOINTMENTS_DELETE,
-        SystemPermission.AUTOMATION_VIEW,
-        SystemPermission.AUTOMATION_CREATE,
-        SystemPermission.AUTOMATION_EDIT,
-        SystemPermission.AUTOMATION_DELETE,
-        SystemPermission.AUTOMATION_MANAGE,
-        SystemPermission.API_KEYS_VIEW,
-        SystemPermission.API_KEYS_CREATE,
-        SystemPermission.API_KEYS_EDIT,
-        SystemPermission.API_KEYS_DELETE,
-        SystemPermission.API_KEYS_MANAGE,
-        SystemPermission.NOTIFICATIONS_VIEW,
-        SystemPermission.SETTINGS_VIEW,
-        SystemPermission.SETTINGS_EDIT,
-        SystemPermission.SYSTEM_ADMIN
-      ];
-    case 'manager':
-      return [
-        ...basicPermissions,
-        SystemPermission.USERS_VIEW,
-        SystemPermission.CUSTOMERS_VIEW,
-        SystemPermission.CUSTOMERS_CREATE,
-        SystemPermission.CUSTOMERS_EDIT,
-        SystemPermission.REQUESTS_VIEW,
-        SystemPermission.REQUESTS_CREATE,
-        SystemPermission.REQUESTS_EDIT,
-        SystemPermission.REQUESTS_APPROVE,
-        SystemPermission.REQUESTS_REJECT,
-        SystemPermission.REQUESTS_ASSIGN,
-        SystemPermission.APPOINTMENTS_VIEW,
-        SystemPermission.APPOINTMENTS_CREATE,
-        SystemPermission.APPOINTMENTS_EDIT,
-        SystemPermission.AUTOMATION_VIEW,
-        SystemPermission.AUTOMATION_CREATE,
-        SystemPermission.AUTOMATION_EDIT,
-        SystemPermission.API_KEYS_VIEW,
-        SystemPermission.API_KEYS_CREATE,
-        SystemPermission.API_KEYS_EDIT,
-        SystemPermission.NOTIFICATIONS_VIEW,
-        SystemPermission.SETTINGS_VIEW
-      ];
-    case 'employee':
-      return [
-        ...basicPermissions,
-        SystemPermission.CUSTOMERS_VIEW,
-        SystemPermission.REQUESTS_VIEW,
-        SystemPermission.REQUESTS_CREATE,
-        SystemPermission.APPOINTMENTS_VIEW,
-        SystemPermission.APPOINTMENTS_CREATE,
-        SystemPermission.NOTIFICATIONS_VIEW
-      ];
-    case 'user':
-      return [
-        ...basicPermissions,
-        SystemPermission.REQUESTS_CREATE,
-        SystemPermission.NOTIFICATIONS_VIEW
-      ];
-    default:
-      return basicPermissions;
-  }
+  // Return a copy so callers can extend the list without touching the shared constant
+  return [...(DEFAULT_ROLE_PERMISSIONS.get(normalizedRole) ?? BASIC_ROLE_PERMISSIONS)];
 }
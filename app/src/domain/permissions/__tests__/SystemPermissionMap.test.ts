@@ -55,6 +55,12 @@ describe('SystemPermissionMap', () => {
         }
       });
     });
+    
+    it('should freeze every definition in the map', () => {
+      Object.values(SystemPermissionMap).forEach(definition => {
+        expect(Object.isFrozen(definition)).toBe(true);
+      });
+    });
   });
   
   describe('getPermissionDefinition', () => {
@@ -131,6 +137,19 @@ describe('SystemPermissionMap', () => {
       const nullInput = createPermissionDefinitionList(null);
       expect(nullInput.length).toBe(Object.values(SystemPermission).length);
     });
+    
+    it('should return a new array of frozen definitions on each call', () => {
+      const first = createPermissionDefinitionList();
+      const second = createPermissionDefinitionList();
+      
+      expect(first).not.toBe(second);
+      expect(first).toEqual(second);
+      expect(Object.isFrozen(first[0])).toBe(true);
+      
+      // Mutating the returned array must not affect later calls
+      first.pop();
+      expect(createPermissionDefinitionList().length).toBe(Object.values(SystemPermission).length);
+    });
   });
   
   describe('getAllPermissionCodes', () => {
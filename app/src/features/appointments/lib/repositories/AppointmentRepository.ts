@@ -757,8 +757,8 @@ export class AppointmentRepository extends PrismaRepository<Appointment, number>
           appointmentId,
           userId: effectiveUserId,
           userName: userName,
-          text,
-          createdAt: new Date()
+          text
+          // createdAt is stamped by the database default,
           // updatedAt is omitted as it doesn't exist in the schema
         }
       });
@@ -363,12 +363,10 @@ describe('LoginForm', () => {
   it('should prevent multiple simultaneous submissions', async () => {
     const user = userEvent.setup();
     
-    // Make signIn take some time to resolve
+    // Keep signIn pending until both clicks have been made
+    let resolveSignIn: (value: any) => void = () => {};
     mockSignIn.mockImplementation(() => 
-      new Promise(resolve => setTimeout(() => resolve({ 
-        success: true, 
-        data: { user: { id: 1 } } 
-      } as any), 100))
+      new Promise(resolve => { resolveSignIn = resolve; })
     );
     
     render(<LoginForm />);
@@ -385,6 +383,11 @@ describe('LoginForm', () => {
     await user.click(submitButton);
     await user.click(submitButton);
 
+    resolveSignIn({ 
+      success: true, 
+      data: { user: { id: 1 } } 
+    });
+
     // Wait for submission to complete
     await waitFor(() => {
       expect(submitButton).not.toBeDisabled();
@@ -619,8 +619,8 @@ async function checkPermissions(
       });
     }
     
-    // Individual permission checks
-    for (const permission of requiredPermissions) {
+    // Individual permission checks, issued concurrently over the same headers
+    const individualResults = await Promise.all(requiredPermissions.map(async (permission) => {
       try {
         const params = new URLSearchParams();
         params.append('userId', userData.userId.toString());
@@ -651,6 +651,12 @@ async function checkPermissions(
           userId: userData.userId
         });
       }
+      
+      return false;
+    }));
+    
+    if (individualResults.some(Boolean)) {
+      return true;
     }
     
     // If we get here, the user doesn't have any of the required permissions
@@ -131,12 +131,12 @@ export async function testPermissionSystem() {
     // Step 2: Make direct API calls to test permission endpoints
     console.log('Step 2: Testing permission endpoints...');
     
-    // Get all permissions
-    const allPermissionsResponse = await ApiClient.get('/api/permissions');
+    // Get all permissions and the user's permissions (independent requests)
+    const [allPermissionsResponse, userPermissionsResponse] = await Promise.all([
+      ApiClient.get('/api/permissions'),
+      ApiClient.get(`/api/users/permissions?userId=${currentUser.id}`)
+    ]);
     console.log('All permissions:', allPermissionsResponse);
-    
-    // Get user permissions
-    const userPermissionsResponse = await ApiClient.get(`/api/users/permissions?userId=${currentUser.id}`);
     console.log('User permissions:', userPermissionsResponse);
     
     // Check specific permissions
@@ -148,28 +148,26 @@ export async function testPermissionSystem() {
       
       // Test each permission
       const permissions = userPermissionsResponse.data.permissions;
-      for (const perm of permissions.slice(0, 5)) { // Test first 5 for brevity
-        const permCode = typeof perm === 'string' ? perm : (perm).code || perm;
-        console.log(`Testing permission: ${permCode}`);
-        
-        const checkResponse = await ApiClient.post('/api/users/permissions/check', {
-          userId: currentUser.id,
-          permissions: [permCode]
-        });
-        
-        console.log(`Permission ${permCode}: ${checkResponse.data?.hasPermission ? 'YES' : 'NO'}`);
-      }
+      const permCodes = permissions.slice(0, 5) // Test first 5 for brevity
+        .map((perm: any) => typeof perm === 'string' ? perm : (perm).code || perm);
       
       // Test a random permission that likely doesn't exist
       const fakePermission = `TEST_PERMISSION_${Date.now()}`;
+      console.log(`Testing permissions: ${permCodes.join(', ')}`);
       console.log(`Testing non-existent permission: ${fakePermission}`);
       
-      const fakeCheckResponse = await ApiClient.post('/api/users/permissions/check', {
-        userId: currentUser.id,
-        permissions: [fakePermission]
-      });
+      // The checks are independent, so run them concurrently
+      const codesToCheck = [...permCodes, fakePermission];
+      const checkResponses = await Promise.all(
+        codesToCheck.map(permCode => ApiClient.post('/api/users/permissions/check', {
+          userId: currentUser.id,
+          permissions: [permCode]
+        }))
+      );
       
-      console.log(`Permission ${fakePermission}: ${fakeCheckResponse.data?.hasPermission ? 'YES' : 'NO'}`);
+      codesToCheck.forEach((permCode, index) => {
+        console.log(`Permission ${permCode}: ${checkResponses[index].data?.hasPermission ? 'YES' : 'NO'}`);
+      });
     }
   } catch (error) {
     console.error('Error during permission system test:', error);
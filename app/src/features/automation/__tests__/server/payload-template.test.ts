@@ -0,0 +1,78 @@
+import { buildPayload } from '../../lib/utils/payload-template';
+import { AutomationEntityType, AutomationOperation } from '@/domain/entities/AutomationWebhook';
+
+const context = {
+  entityType: AutomationEntityType.CUSTOMER,
+  operation: AutomationOperation.CREATE,
+  webhookName: 'Test Webhook',
+  webhookId: 7
+};
+
+describe('payload-template', () => {
+  describe('buildPayload', () => {
+    it('should resolve top-level entity fields', () => {
+      const payload = buildPayload({ name: '{{name}}', id: '{{id}}' }, { id: 1, name: 'Acme' }, context);
+
+      expect(payload).toEqual({ name: 'Acme', id: '1' });
+    });
+
+    it('should give system variables precedence over entity fields', () => {
+      const entity = { operation: 'entity-operation', webhookName: 'entity-name', fullName: 'Entity Name' };
+      const payload = buildPayload(
+        { operation: '{{operation}}', webhookName: '{{webhookName}}' },
+        entity,
+        context
+      );
+
+      expect(payload).toEqual({
+        operation: AutomationOperation.CREATE,
+        webhookName: 'Test Webhook'
+      });
+    });
+
+    it('should resolve dotted nested paths', () => {
+      const entity = { customer: { address: { city: 'Berlin' } } };
+      const payload = buildPayload(
+        { city: '{{customer.address.city}}', viaData: '{{data.customer.address.city}}' },
+        entity,
+        context
+      );
+
+      expect(payload).toEqual({ city: 'Berlin', viaData: 'Berlin' });
+    });
+
+    it('should resolve array index paths', () => {
+      const entity = { items: [{ name: 'First' }, { name: 'Second' }] };
+      const payload = buildPayload({ second: '{{items.1.name}}' }, entity, context);
+
+      expect(payload).toEqual({ second: 'Second' });
+    });
+
+    it('should render missing variables as empty strings', () => {
+      const payload = buildPayload(
+        { missing: '{{doesNotExist}}', nested: '{{name.first}}', text: 'Hello {{unknown}}!' },
+        { name: 'Acme' },
+        context
+      );
+
+      expect(payload).toEqual({ missing: '', nested: '', text: 'Hello !' });
+    });
+
+    it('should not resolve inherited methods of class-instance entities', () => {
+      class Entity {
+        name = 'Acme';
+        describe() {
+          return 'method';
+        }
+      }
+
+      const payload = buildPayload(
+        { name: '{{name}}', method: '{{describe}}', json: '{{toString}}' },
+        new Entity(),
+        context
+      );
+
+      expect(payload).toEqual({ name: 'Acme', method: '', json: '' });
+    });
+  });
+});
@@ -0,0 +1,58 @@
+import {
+  readResponseBody,
+  RESPONSE_BODY_TRUNCATION_MARKER
+} from '../../lib/utils/webhook-executor';
+
+/**
+ * Creates a response whose body yields the given chunks one read at a time
+ */
+function createStreamingResponse(chunks: string[]) {
+  const encoder = new TextEncoder();
+  const queue = chunks.map(chunk => encoder.encode(chunk));
+  const reader = {
+    read: jest.fn(async () => {
+      const value = queue.shift();
+      return value ? { done: false, value } : { done: true, value: undefined };
+    }),
+    cancel: jest.fn().mockResolvedValue(undefined)
+  };
+
+  const response = { body: { getReader: () => reader } } as unknown as Response;
+  return { response, reader };
+}
+
+describe('webhook-executor', () => {
+  describe('readResponseBody', () => {
+    it('should return an empty string when there is no body', async () => {
+      const response = { body: null } as unknown as Response;
+
+      await expect(readResponseBody(response)).resolves.toBe('');
+    });
+
+    it('should return the whole body when it is under the limit', async () => {
+      const { response, reader } = createStreamingResponse(['{"ok":', 'true}']);
+
+      await expect(readResponseBody(response, 100)).resolves.toBe('{"ok":true}');
+      expect(reader.read).toHaveBeenCalledTimes(3);
+    });
+
+    it('should truncate a multi-chunk body over the limit and cancel the reader', async () => {
+      const { response, reader } = createStreamingResponse(['aaaa', 'bbbb', 'cccc', 'dddd']);
+
+      const body = await readResponseBody(response, 6);
+
+      expect(body).toBe(`aaaabb${RESPONSE_BODY_TRUNCATION_MARKER}`);
+      // Reading stops once the limit is passed, the rest is never pulled
+      expect(reader.read).toHaveBeenCalledTimes(2);
+      expect(reader.cancel).toHaveBeenCalled();
+    });
+
+    it('should not split a surrogate pair at the cut', async () => {
+      const { response } = createStreamingResponse(['ab😀cd']);
+
+      const body = await readResponseBody(response, 3);
+
+      expect(body).toBe(`ab${RESPONSE_BODY_TRUNCATION_MARKER}`);
+    });
+  });
+});
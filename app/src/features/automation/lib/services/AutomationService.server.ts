@@ -31,7 +31,7 @@ import { AppError } from '@/types/errors';
 import { buildPayload, validateTemplate, getDefaultTemplate, ENTITY_VARIABLES, SYSTEM_VARIABLES } from '../utils/payload-template';
 import { validateWebhookConfig } from '../utils/webhook-validator';
 import { validateCronExpression, describeCronExpression, getNextRunTime } from '../utils/cron-parser';
-import { executeWebhook, testWebhookUrl } from '../utils/webhook-executor';
+import { executeWebhook, testWebhookUrl, readResponseBody } from '../utils/webhook-executor';
 
 /**
  * Server-side implementation of the AutomationService
@@ -1164,7 +1164,7 @@ export class AutomationService extends BaseService<
       });
       
       const executionTime = Date.now() - startTime;
-      const responseBody = await response.text();
+      const responseBody = await readResponseBody(response);
       
       if (response.ok) {
         execution.markAsSuccessful(response.status, responseBody, executionTime);
@@ -187,15 +187,13 @@ export function buildPayload(
     template = getDefaultTemplate(context.entityType, context.operation);
   }
   
-  // Prepare all available variables
-  const variables: Record<string, any> = {
-    // Entity data (flatten if needed)
-    ...flattenObject(entityData),
-    
-    // System variables
-    timestamp: new Date().toISOString(),
-    date: new Date().toLocaleDateString(),
-    time: new Date().toLocaleTimeString(),
+  const now = new Date();
+  
+  // System variables (these take precedence over entity fields)
+  const systemVariables: Record<string, any> = {
+    timestamp: now.toISOString(),
+    date: now.toLocaleDateString(),
+    time: now.toLocaleTimeString(),
     entityType: context.entityType,
     operation: context.operation,
     webhookName: context.webhookName || '',
@@ -208,30 +206,30 @@ export function buildPayload(
     data: entityData
   };
   
-  // Process template
-  return processTemplate(template, variables);
+  // Entity data is looked up in place instead of being copied into the variables
+  return processTemplate(template, [systemVariables, entityData]);
 }
 
 /**
  * Process template by replacing variables
  */
-function processTemplate(template: any, variables: Record<string, any>): any {
+function processTemplate(template: any, scopes: any[]): any {
   if (typeof template === 'string') {
     // Replace {{variable}} patterns
     return template.replace(/\{\{([^}]+)\}\}/g, (match, varName) => {
-      const value = getVariable(variables, varName.trim());
+      const value = getVariable(scopes, varName.trim());
       return value !== undefined ? String(value) : '';
     });
   }
   
   if (Array.isArray(template)) {
-    return template.map(item => processTemplate(item, variables));
+    return template.map(item => processTemplate(item, scopes));
   }
   
   if (template && typeof template === 'object') {
     const result: Record<string, any> = {};
     for (const [key, value] of Object.entries(template)) {
-      result[key] = processTemplate(value, variables);
+      result[key] = processTemplate(value, scopes);
     }
     return result;
   }
@@ -241,12 +239,25 @@ function processTemplate(template: any, variables: Record<string, any>): any {
 
 /**
  * Get variable value with dot notation support
+ * 
+ * The first path segment is resolved against the scopes in order, the rest
+ * walks into the matched value
  */
-function getVariable(variables: Record<string, any>, path: string): any {
-  const parts = path.split('.');
-  let value = variables;
+function getVariable(scopes: any[], path: string): any {
+  const [head, ...rest] = path.split('.');
+  // Only own properties resolve at the top level, so methods and getters
+  // inherited by class-instance entities can't be reached from a template
+  const scope = scopes.find(candidate =>
+    candidate && typeof candidate === 'object' && Object.prototype.hasOwnProperty.call(candidate, head)
+  );
+  
+  if (!scope) {
+    return undefined;
+  }
   
-  for (const part of parts) {
+  let value = scope[head];
+  
+  for (const part of rest) {
     if (value && typeof value === 'object' && part in value) {
       value = value[part];
     } else {
@@ -257,32 +268,6 @@ function getVariable(variables: Record<string, any>, path: string): any {
   return value;
 }
 
-/**
- * Flatten object for easier access
- */
-function flattenObject(obj: any, prefix: string = ''): Record<string, any> {
-  const result: Record<string, any> = {};
-  
-  if (!obj || typeof obj !== 'object') {
-    return result;
-  }
-  
-  for (const [key, value] of Object.entries(obj)) {
-    const newKey = prefix ? `${prefix}.${key}` : key;
-    
-    if (value && typeof value === 'object' && !Array.isArray(value) && !(value instanceof Date)) {
-      // Don't flatten too deep
-      if (prefix.split('.').length < 2) {
-        Object.assign(result, flattenObject(value, newKey));
-      }
-    }
-    
-    result[newKey] = value;
-  }
-  
-  return result;
-}
-
 /**
  * Validate payload template
  */
@@ -7,6 +7,64 @@
 import { AutomationEntityType, AutomationOperation } from '@/domain/entities/AutomationWebhook';
 import { buildPayload } from './payload-template';
 
+/**
+ * Maximum number of response body characters kept for execution records
+ */
+export const MAX_RESPONSE_BODY_LENGTH = 10000;
+
+/**
+ * Appended to a response body that was cut off at the maximum length
+ */
+export const RESPONSE_BODY_TRUNCATION_MARKER = '…[truncated]';
+
+/**
+ * Read a response body up to a maximum length
+ * 
+ * Stops reading and cancels the stream once the limit is passed, so a large
+ * or misbehaving endpoint can't make us buffer its whole response. Truncated
+ * bodies end with RESPONSE_BODY_TRUNCATION_MARKER.
+ */
+export async function readResponseBody(
+  response: Response,
+  maxLength: number = MAX_RESPONSE_BODY_LENGTH
+): Promise<string> {
+  if (!response.body) {
+    return '';
+  }
+  
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let body = '';
+  
+  try {
+    // Read until the body exceeds the limit, so we know whether it was cut off
+    while (body.length <= maxLength) {
+      const { done, value } = await reader.read();
+      if (done) {
+        body += decoder.decode();
+        break;
+      }
+      body += decoder.decode(value, { stream: true });
+    }
+  } finally {
+    // Release the connection without draining the remaining body
+    reader.cancel().catch(() => undefined);
+  }
+  
+  if (body.length <= maxLength) {
+    return body;
+  }
+  
+  // Don't split a UTF-16 surrogate pair at the cut
+  let end = maxLength;
+  const lastCode = body.charCodeAt(end - 1);
+  if (lastCode >= 0xd800 && lastCode <= 0xdbff) {
+    end--;
+  }
+  
+  return body.slice(0, end) + RESPONSE_BODY_TRUNCATION_MARKER;
+}
+
 /**
  * Execute a webhook with proper error handling and logging
  */
@@ -64,7 +122,7 @@ export async function executeWebhook(
     let responseBody = '';
     
     try {
-      responseBody = await response.text();
+      responseBody = await readResponseBody(response);
     } catch (e) {
       console.warn('[Webhook Execution] Could not read response body');
     }
@@ -146,7 +204,7 @@ export async function testWebhookUrl(
     let responseBody = '';
     
     try {
-      responseBody = await response.text();
+      responseBody = await readResponseBody(response);
     } catch (e) {
       console.warn('[Webhook Test] Could not read response body');
     }
@@ -61,6 +61,17 @@ export const WEBHOOK_SERVICE_CONFIGS = {
   }
 };
 
+/**
+ * Recommendations shown for each identified webhook service
+ */
+const SERVICE_RECOMMENDATIONS: Partial<Record<string, string>> = {
+  n8n: 'n8n webhooks only accept POST requests with JSON payloads',
+  slack: 'Slack webhooks require specific JSON format for messages',
+  discord: 'Discord webhooks support rich embeds and mentions',
+  teams: 'Teams webhooks use MessageCard format',
+  generic: 'For generic webhooks, ensure the endpoint can handle your payload format'
+};
+
 /**
  * Identifies webhook service configuration
  */
@@ -418,19 +429,13 @@ export function validateWebhookUrlEnhanced(url: string): {
     }
     
     // Service-specific recommendations
-    if (serviceType === 'n8n') {
-      recommendations.push('n8n webhooks only accept POST requests with JSON payloads');
-      if (!parsedUrl.pathname.includes('/webhook')) {
-        warnings.push('n8n webhook URLs typically contain "/webhook" in the path');
-      }
-    } else if (serviceType === 'slack') {
-      recommendations.push('Slack webhooks require specific JSON format for messages');
-    } else if (serviceType === 'discord') {
-      recommendations.push('Discord webhooks support rich embeds and mentions');
-    } else if (serviceType === 'teams') {
-      recommendations.push('Teams webhooks use MessageCard format');
-    } else if (serviceType === 'generic') {
-      recommendations.push('For generic webhooks, ensure the endpoint can handle your payload format');
+    const serviceRecommendation = SERVICE_RECOMMENDATIONS[serviceType];
+    if (serviceRecommendation) {
+      recommendations.push(serviceRecommendation);
+    }
+    
+    if (serviceType === 'n8n' && !parsedUrl.pathname.includes('/webhook')) {
+      warnings.push('n8n webhook URLs typically contain "/webhook" in the path');
     }
     
   } catch (error) {
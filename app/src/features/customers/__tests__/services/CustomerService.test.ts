@@ -348,6 +348,33 @@ describe('CustomerService', () => {
         CommonStatus.INACTIVE,
         0
       );
+      expect(mockRepository.addNote).toHaveBeenCalledWith(
+        1,
+        0,
+        `Status changed to ${CommonStatus.INACTIVE}: Customer requested deactivation`
+      );
+      // The note is written only after the status change
+      expect(mockRepository.updateStatus.mock.invocationCallOrder[0])
+        .toBeLessThan(mockRepository.addNote.mock.invocationCallOrder[0]);
+    });
+
+    it('should not add the reason note when the status update fails', async () => {
+      const customer = new Customer({
+        id: 1,
+        name: 'John Doe',
+        email: 'john@example.com',
+        type: CustomerType.INDIVIDUAL,
+        status: CommonStatus.ACTIVE,
+      });
+
+      mockRepository.findById.mockResolvedValue(customer);
+      mockRepository.updateStatus.mockRejectedValue(new Error('Database error'));
+
+      await expect(service.updateStatus(1, {
+        status: CommonStatus.INACTIVE,
+        reason: 'Customer requested deactivation',
+      })).rejects.toThrow();
+      expect(mockRepository.addNote).not.toHaveBeenCalled();
     });
   });
 
@@ -569,8 +569,8 @@ export class CustomerRepository extends PrismaRepository<Customer> implements IC
           userId: data.userId,
           userName,
           action: data.action,
-          details: data.details,
-          createdAt: new Date()
+          details: data.details
+          // createdAt is stamped by the database default
         }
       });
     } catch (error) {
@@ -789,8 +789,8 @@ export class CustomerRepository extends PrismaRepository<Customer> implements IC
           userId,
           userName,
           action: LogActionType.NOTE,
-          details: note,
-          createdAt: new Date()
+          details: note
+          // createdAt is stamped by the database default
         }
       });
       
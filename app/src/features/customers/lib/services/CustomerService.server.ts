@@ -1353,27 +1353,32 @@ export class CustomerService implements ICustomerService {
     try {
       this.logger.debug('Getting customer statistics', { options });
       
-      // Get total count
-      const totalCount = await this.repository.count();
+      const statuses = Object.values(CommonStatus);
+      const types = Object.values(CustomerType);
+      
+      // The counts and the recent-customer lookup are independent queries, so run them concurrently
+      const [totalCount, statusCountValues, typeCountValues, recentCustomers] = await Promise.all([
+        // Get total count
+        this.repository.count(),
+        // Get counts by status
+        Promise.all(statuses.map(status => this.repository.count({ status }))),
+        // Get counts by type
+        Promise.all(types.map(type => this.repository.count({ type }))),
+        // Get recent customers
+        this.repository.findByCriteria({}, {
+          limit: 5,
+          sort: { field: 'createdAt', direction: 'desc' }
+        })
+      ]);
       
-      // Get counts by status
       const statusCounts: Record<string, number> = {};
-      for (const status of Object.values(CommonStatus)) {
-        const count = await this.repository.count({ status });
-        statusCounts[status] = count;
-      }
+      statuses.forEach((status, index) => {
+        statusCounts[status] = statusCountValues[index];
+      });
       
-      // Get counts by type
       const typeCounts: Record<string, number> = {};
-      for (const type of Object.values(CustomerType)) {
-        const count = await this.repository.count({ type });
-        typeCounts[type as string] = count;
-      }
-      
-      // Get recent customers
-      const recentCustomers = await this.repository.findByCriteria({}, {
-        limit: 5,
-        sort: { field: 'createdAt', direction: 'desc' }
+      types.forEach((type, index) => {
+        typeCounts[type as string] = typeCountValues[index];
       });
       
       return {
@@ -5,6 +5,7 @@ import { PaginationResult } from '@/domain/repositories/IBaseRepository';
 import { ILoggingService } from '@/core/logging/ILoggingService';
 import { IErrorHandler } from '@/core/errors/';
 import { QueryOptions } from '@/core/repositories/PrismaRepository';
+import { getDefaultPermissionsForRole as getSystemDefaultPermissionsForRole } from '@/domain/permissions/SystemPermissionMap';
 
 // Type for role permission with included permission
 interface RolePermissionWithPermission {
@@ -301,92 +302,8 @@ export class PermissionRepository implements IPermissionRepository {
       throw this.errorHandler.createError('Role is required');
     }
     
-    // Basic permissions that all roles should have
-    const basicPermissions = [
-      'profile.view',
-      'profile.edit',
-      'dashboard.access'
-    ];
-    
-    switch(role) {
-      case 'admin':
-        // Admin gets ALL available permissions in the system
-        return [
-          ...basicPermissions,
-          // User permissions
-          'users.view',
-          'users.create',
-          'users.edit',
-          'users.delete',
-          // Permission management
-          'permissions.view',
-          'permissions.manage',
-          // Customer permissions
-          'customers.view',
-          'customers.create',
-          'customers.edit',
-          'customers.delete',
-          // Request permissions
-          'requests.view',
-          'requests.create',
-          'requests.edit',
-          'requests.delete',
-          'requests.approve',
-          'requests.reject',
-          'requests.assign',
-          'requests.convert',
-          // Appointment permissions
-          'appointments.view',
-          'appointments.create',
-          'appointments.edit',
-          'appointments.delete',
-          // Settings permissions
-          'settings.view',
-          'settings.edit',
-          // API Key permissions
-          'api_keys.view',
-          'api_keys.create',
-          'api_keys.edit',
-          'api_keys.delete',
-          'api_keys.manage',
-          // Automation permissions
-          'automation.view',
-          'automation.create',
-          'automation.edit',
-          'automation.delete',
-          'automation.manage',
-          // Notification permissions
-          'notifications.view',
-          // System permissions
-          'system.admin'
-        ];
-      case 'manager':
-        return [
-          ...basicPermissions,
-          'users.view',
-          'customers.view',
-          'customers.create',
-          'customers.edit',
-          'requests.view',
-          'requests.create',
-          'requests.edit',
-          'appointments.view',
-          'appointments.create',
-          'appointments.edit',
-          'settings.view'
-        ];
-      case 'employee':
-        return [
-          ...basicPermissions,
-          'customers.view',
-          'requests.view',
-          'requests.create',
-          'appointments.view',
-          'appointments.create'
-        ];
-      default:
-        return basicPermissions;
-    }
+    // SystemPermissionMap is the single source of truth for role defaults
+    return getSystemDefaultPermissionsForRole(role);
   }
 
   /**
@@ -435,8 +352,10 @@ export class PermissionRepository implements IPermissionRepository {
     const rolePermissionStrings = rolePermissionCodes.map(String);
     
     // Determine which permissions need to be explicitly added or removed
-    const additionalPermissions = permissionStrings.filter((p: any) => !rolePermissionStrings.includes(p));
-    const removedPermissions = rolePermissionStrings.filter((p: any) => !permissionStrings.includes(p));
+    const requestedSet = new Set(permissionStrings);
+    const roleSet = new Set(rolePermissionStrings);
+    const additionalPermissions = permissionStrings.filter(p => !roleSet.has(p));
+    const removedPermissions = rolePermissionStrings.filter(p => !requestedSet.has(p));
     
     // Run this as a transaction
     await this.prisma.$transaction(async (tx: any) => {
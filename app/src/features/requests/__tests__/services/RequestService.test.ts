@@ -0,0 +1,114 @@
+import { RequestService } from '@/features/requests/lib/services/RequestService';
+import { IRequestRepository } from '@/domain/repositories/IRequestRepository';
+import { IUserRepository } from '@/domain/repositories/IUserRepository';
+import { ContactRequest } from '@/domain/entities/ContactRequest';
+import { RequestStatus } from '@/domain/enums/CommonEnums';
+
+jest.mock('@/core/api/ApiClient', () => ({
+  ApiClient: { get: jest.fn() },
+}));
+
+describe('RequestService', () => {
+  let service: RequestService;
+  let mockRequestRepository: jest.Mocked<IRequestRepository>;
+  let mockUserRepository: jest.Mocked<IUserRepository>;
+
+  const createRequest = () => new ContactRequest({
+    id: 1,
+    name: 'Max Mustermann',
+    email: 'max@example.com',
+    service: 'Beratung',
+    message: 'Ich hätte gerne Informationen zu Ihren Dienstleistungen.',
+    status: RequestStatus.NEW,
+  });
+
+  beforeEach(() => {
+    mockRequestRepository = {
+      findById: jest.fn(),
+      update: jest.fn(),
+      addNote: jest.fn(),
+    } as any;
+
+    mockUserRepository = {
+      findById: jest.fn(),
+    } as any;
+
+    const mockLogger = {
+      info: jest.fn(),
+      error: jest.fn(),
+      warn: jest.fn(),
+      debug: jest.fn(),
+    } as any;
+
+    const mockErrorHandler = {
+      createNotFoundError: jest.fn((message: string) => new Error(message)),
+      createValidationError: jest.fn((message: string) => new Error(message)),
+      handleError: jest.fn((error: any) => error),
+    } as any;
+
+    service = new RequestService(
+      mockRequestRepository,
+      {} as any,
+      mockUserRepository,
+      {} as any,
+      null,
+      mockLogger,
+      { validate: jest.fn() } as any,
+      mockErrorHandler
+    );
+  });
+
+  describe('assignRequest', () => {
+    it('should fall back to the default note text for a blank note', async () => {
+      const request = createRequest();
+      mockRequestRepository.findById.mockResolvedValue(request);
+      mockRequestRepository.update.mockResolvedValue(request);
+      mockUserRepository.findById.mockResolvedValue({ firstName: 'Erika', lastName: 'Muster' } as any);
+
+      await service.assignRequest(1, 5, '   ', { context: { userId: 2 } });
+
+      expect(mockRequestRepository.addNote).toHaveBeenCalledWith(
+        1,
+        2,
+        'Erika Muster',
+        'Request assigned to processor ID 5'
+      );
+    });
+
+    it('should look up the acting user while the update is still running', async () => {
+      const request = createRequest();
+      let resolveUpdate: (value: ContactRequest) => void = () => {};
+      mockRequestRepository.findById.mockResolvedValue(request);
+      mockRequestRepository.update.mockReturnValue(
+        new Promise(resolve => { resolveUpdate = resolve; })
+      );
+      mockUserRepository.findById.mockResolvedValue(null);
+
+      const pending = service.assignRequest(1, 5, 'Please handle', { context: { userId: 2 } });
+
+      // Let the request lookup settle; the update is still pending
+      await new Promise(resolve => setImmediate(resolve));
+
+      expect(mockUserRepository.findById).toHaveBeenCalledWith(2);
+      expect(mockRequestRepository.addNote).not.toHaveBeenCalled();
+
+      resolveUpdate(request);
+      await pending;
+
+      expect(mockRequestRepository.addNote).toHaveBeenCalledWith(1, 2, 'System', 'Please handle');
+    });
+
+    it('should not write a note without an acting user', async () => {
+      const request = createRequest();
+      mockRequestRepository.findById.mockResolvedValue(request);
+      mockRequestRepository.update.mockResolvedValue(request);
+
+      const result = await service.assignRequest(1, 5, 'Please handle');
+
+      expect(result.processorId).toBe(5);
+      expect(result.status).toBe(RequestStatus.IN_PROGRESS);
+      expect(mockUserRepository.findById).not.toHaveBeenCalled();
+      expect(mockRequestRepository.addNote).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -94,10 +94,6 @@ export const POST = apiAuth(async (request: NextRequest, user: any) => {
       // Create appointment with the parsed date
       console.log(`Creating appointment for request ${id} with user ${userId}`);
       
-      // Create a formatted ISO date string
-      const isoDateString = appointmentDate.toISOString();
-      console.log(`ISO date string: ${isoDateString}`);
-      
       const result = await requestService.createAppointmentForRequest(
         id,
         {
@@ -32,6 +32,35 @@ import {
 } from '@/domain/utils/statusUtils';
 import { ApiClient } from '@/core/api/ApiClient';
 
+/**
+ * Validation schema for request creation
+ *
+ * Static, so it is built once at module load rather than on every validate() call
+ */
+const CREATE_VALIDATION_SCHEMA = Object.freeze({
+  name: { type: 'string', minLength: 2, maxLength: 100, required: true },
+  email: { type: 'string', format: 'email', required: true },
+  phone: { type: 'string', pattern: '^[+]?[(]?[0-9]{3}[)]?[-\s.]?[0-9]{3}[-\s.]?[0-9]{4,6}$', required: false },
+  service: { type: 'string', minLength: 2, maxLength: 100, required: true },
+  message: { type: 'string', minLength: 10, maxLength: 1000, required: true },
+  ipAddress: { type: 'string', required: false }
+});
+
+/**
+ * Validation schema for request updates
+ */
+const UPDATE_VALIDATION_SCHEMA = Object.freeze({
+  name: { type: 'string', minLength: 2, maxLength: 100, required: false },
+  email: { type: 'string', format: 'email', required: false },
+  phone: { type: 'string', pattern: '^[+]?[(]?[0-9]{3}[)]?[-\\s.]?[0-9]{3}[-\\s.]?[0-9]{4,6}$', required: false },
+  service: { type: 'string', minLength: 2, maxLength: 100, required: false },
+  message: { type: 'string', minLength: 10, maxLength: 1000, required: false },
+  status: { type: 'string', enum: Object.values(RequestStatus), required: false },
+  processorId: { type: 'number', required: false },
+  customerId: { type: 'number', required: false },
+  appointmentId: { type: 'number', required: false }
+});
+
 /**
  * Service for contact requests
  * 
@@ -564,15 +593,19 @@ export class RequestService extends BaseService<
       
       request.updateAuditData(options?.context?.userId);
 
-      // Save the changes
-      const updatedRequest = await this.requestRepository.update(id, request);
+      // Save the changes and look up the acting user for the note in parallel
+      const actingUserId = options?.context?.userId;
+      const [updatedRequest, user] = await Promise.all([
+        this.requestRepository.update(id, request),
+        actingUserId ? this.userRepository.findById(actingUserId) : null
+      ]);
 
-      // Add a note
-      if (options?.context?.userId) {
-        const user = await this.userRepository.findById(options.context.userId);
+      // Add a note (the request was loaded above and blank notes fall back to the
+      // default text, so go straight to the repository instead of through addNote)
+      if (actingUserId) {
         const userName = user ? `${user.firstName || ''} ${user.lastName || ''}`.trim() : 'System';
-        const noteText = note || `Request assigned to processor ID ${userId}`;
-        await this.addNote(id, options.context.userId, userName, noteText, options);
+        const noteText = note && note.trim() ? note : `Request assigned to processor ID ${userId}`;
+        await this.requestRepository.addNote(id, actingUserId, userName, noteText);
       }
 
       return this.toDTO(updatedRequest);
@@ -796,9 +829,11 @@ export class RequestService extends BaseService<
       const appointmentEntity: Partial<Appointment> = {
         title: appointmentData.title || `Appointment for ${request.name}`,
         customerId: request.customerId,
-        appointmentDate: appointmentData.appointmentDate 
-          ? new Date(appointmentData.appointmentDate) 
-          : new Date(),
+        appointmentDate: appointmentData.appointmentDate instanceof Date
+          ? appointmentData.appointmentDate
+          : appointmentData.appointmentDate
+            ? new Date(appointmentData.appointmentDate)
+            : new Date(),
         duration: appointmentData.duration || 60,
         location: appointmentData.location,
         description: appointmentData.description || request.message,
@@ -973,31 +1008,14 @@ export class RequestService extends BaseService<
    * Returns the validation schema for creation
    */
   protected getCreateValidationSchema(): any {
-    return {
-      name: { type: 'string', minLength: 2, maxLength: 100, required: true },
-      email: { type: 'string', format: 'email', required: true },
-      phone: { type: 'string', pattern: '^[+]?[(]?[0-9]{3}[)]?[-\s.]?[0-9]{3}[-\s.]?[0-9]{4,6}$', required: false },
-      service: { type: 'string', minLength: 2, maxLength: 100, required: true },
-      message: { type: 'string', minLength: 10, maxLength: 1000, required: true },
-      ipAddress: { type: 'string', required: false }
-    };
+    return CREATE_VALIDATION_SCHEMA;
   }
 
   /**
    * Returns the validation schema for updates
    */
   protected getUpdateValidationSchema(): any {
-    return {
-      name: { type: 'string', minLength: 2, maxLength: 100, required: false },
-      email: { type: 'string', format: 'email', required: false },
-      phone: { type: 'string', pattern: '^[+]?[(]?[0-9]{3}[)]?[-\\s.]?[0-9]{3}[-\\s.]?[0-9]{4,6}$', required: false },
-      service: { type: 'string', minLength: 2, maxLength: 100, required: false },
-      message: { type: 'string', minLength: 10, maxLength: 1000, required: false },
-      status: { type: 'string', enum: Object.values(RequestStatus), required: false },
-      processorId: { type: 'number', required: false },
-      customerId: { type: 'number', required: false },
-      appointmentId: { type: 'number', required: false }
-    };
+    return UPDATE_VALIDATION_SCHEMA;
   }
 }
 
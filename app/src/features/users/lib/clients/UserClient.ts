@@ -15,6 +15,19 @@ import { PaginationResult } from '@/domain/repositories/IBaseRepository';
 // API-URL for Users
 const USERS_API_URL = '/users';
 
+type ApiMethod = 'get' | 'post' | 'put' | 'delete' | 'patch';
+
+/**
+ * Dispatch table from request method to the matching API client call
+ */
+const API_METHODS: Record<ApiMethod, (url: string, data?: any) => Promise<ApiResponse<any>>> = {
+  get: (url) => ApiClient.get(url),
+  post: (url, data) => ApiClient.post(url, data),
+  put: (url, data) => ApiClient.put(url, data),
+  delete: (url) => ApiClient.delete(url),
+  patch: (url, data) => ApiClient.patch(url, data)
+};
+
 /**
  * Client for User API requests
  */
@@ -38,7 +51,7 @@ export class UserClient {
    * @returns API response
    */
   private static apiRequest<T>(
-    method: 'get' | 'post' | 'put' | 'delete' | 'patch',
+    method: ApiMethod,
     url: string, 
     data?: any,
     customParams?: { maxRetries?: number }
@@ -51,26 +64,17 @@ export class UserClient {
       // Implement retry logic for transient errors
       while (attempts <= maxRetries) {
         try {
-          let result: Promise<ApiResponse<T>>;
-          
-          // Use the appropriate method from the API client
-          // Important: DO NOT await these calls here!
-          if (method === 'get') {
-            result = ApiClient.get(url);
-          } else if (method === 'post') {
-            result = ApiClient.post(url, data);
-          } else if (method === 'put') {
-            result = ApiClient.put(url, data);
-          } else if (method === 'delete') {
-            result = ApiClient.delete(url);
-          } else if (method === 'patch') {
-            result = ApiClient.patch(url, data);
-          } else {
+          // Look up the appropriate method from the API client
+          const request = API_METHODS[method];
+          if (!request) {
             // If we get here, method was invalid (shouldn't happen due to TypeScript)
             reject(new Error(`Invalid API method: ${method}`));
             return;
           }
           
+          // Important: DO NOT await this call here!
+          const result = request(url, data) as Promise<ApiResponse<T>>;
+          
           // Return the promise directly - don't await it here
           // This allows the calling methods to use the two-step await pattern
           resolve(result);